@@ -0,0 +1,13 @@
+"""
+Platform Detection Constants
+
+Computed once at package import from sys.platform (a constant string,
+so no subprocess or syscall cost) and shared by every module that needs
+platform dispatch, guaranteeing they all agree.
+"""
+
+import sys
+
+IS_WIN = sys.platform.startswith("win")
+IS_MAC = sys.platform == "darwin"
+IS_LINUX = sys.platform.startswith("linux")
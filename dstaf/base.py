@@ -8,17 +8,23 @@ application to run in the application server instance.
 
 from __future__ import annotations
 
+import ast
 import concurrent
+import functools
 import inspect
+import itertools
 import json
 import logging
+import os
+import queue
+import textwrap
+import threading
 import time
-import traceback
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from multiprocessing import cpu_count
+from dataclasses import asdict, dataclass
 from multiprocessing.shared_memory import SharedMemory
-from typing import Union
+from typing import ClassVar, Union
 from uuid import UUID, uuid4
 
 from .enumerators import HorizontalAlignment, VerticalAlignment
@@ -28,15 +34,214 @@ APP_SERVER_DEFAULT_INSTANCE = None  # pylint: disable=invalid-name
 
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(asctime)s.%(msecs)03d+00:00 [%(levelname)s] %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-logging.Formatter.converter = time.gmtime
 
 
-class ApplicationServer:
+class _CachedFormatter(logging.Formatter):
+    """
+    Formatter that caches the strftime result per second.
+
+    The seconds portion of a UTC timestamp only changes once per second,
+    so re-running strftime for every record is wasted work on busy logs.
+    Only the millisecond suffix (handled by the format string) varies
+    per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_second = 0
+        self._last_asctime = ""
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_asctime = time.strftime(
+                datefmt or self.datefmt or self.default_time_format,
+                time.gmtime(second),
+            )
+        return self._last_asctime
+
+
+def _configure_default_logging():
+    """
+    Apply the default logging configuration for the package.
+
+    Deferred to ApplicationServer construction (rather than module
+    import) so that merely importing dstaf does not mutate global
+    logging state for the host process. Consumers who want more detail
+    can opt in with logging.getLogger("dstaf").setLevel(logging.DEBUG).
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        _CachedFormatter(
+            fmt="%(asctime)s.%(msecs)03d+00:00 [%(levelname)s] %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+
+def _parse_cpu_list(text: str) -> set:
+    """
+    Parse a sysfs cpulist string such as '0-3,8-11' into a set of CPU
+    numbers.
+
+    :param text: cpulist string as read from sysfs
+    :return: set of CPU numbers
+    """
+    cpus = set()
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            cpus.update(range(int(start), int(end) + 1))
+        else:
+            cpus.add(int(part))
+    return cpus
+
+
+@functools.lru_cache(maxsize=None)
+def _numa_groups() -> tuple:
+    """
+    Enumerate the CPUs of each NUMA node, restricted to the CPUs
+    available to this process. The topology is read from sysfs once
+    and cached.
+
+    :return: tuple of frozensets of CPU numbers; empty on single-node
+        machines or when the topology cannot be read
+    """
+    try:
+        available = os.sched_getaffinity(0)
+    except AttributeError:
+        return ()
+    groups = []
+    try:
+        nodes = sorted(
+            entry
+            for entry in os.listdir("/sys/devices/system/node")
+            if entry.startswith("node") and entry[4:].isdigit()
+        )
+        for node in nodes:
+            path = f"/sys/devices/system/node/{node}/cpulist"
+            with open(path, encoding="ascii") as cpu_list:
+                cpus = _parse_cpu_list(cpu_list.read()) & available
+            if cpus:
+                groups.append(frozenset(cpus))
+    except OSError:
+        return ()
+    # A single node gives the scheduler nothing to keep local, so only
+    # report multi-node topologies
+    return tuple(groups) if len(groups) > 1 else ()
+
+
+@functools.lru_cache(maxsize=None)
+def _llc_groups() -> tuple:
+    """
+    Enumerate groups of CPUs that share a last-level cache, restricted
+    to the CPUs available to this process. The topology is read from
+    sysfs once and cached.
+
+    :return: tuple of frozensets of CPU numbers; empty when the
+        topology cannot be read (non-Linux or unusual layouts)
+    """
+    try:
+        available = os.sched_getaffinity(0)
+    except AttributeError:
+        return ()
+    groups = {}
+    for cpu in available:
+        path = f"/sys/devices/system/cpu/cpu{cpu}/cache/index3/shared_cpu_list"
+        try:
+            with open(path, encoding="ascii") as shared_list:
+                key = shared_list.read().strip()
+        except OSError:
+            return ()
+        groups.setdefault(key, set()).add(cpu)
+    return tuple(frozenset(group) for group in groups.values())
+
+
+def _make_pin_initializer():
+    """
+    Build a ThreadPoolExecutor initializer that pins each new worker
+    thread, round-robin, to a group of related cores: the cores of one
+    NUMA node on multi-socket machines, else the cores sharing a
+    last-level cache, else a single core where neither topology can be
+    read. Constraining workers to one memory/cache domain keeps their
+    data local while still leaving the scheduler freedom within the
+    group.
+
+    :return: Initializer callable, or None where unsupported
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    groups = _numa_groups() or _llc_groups()
+    if len(groups) > 1:
+        targets = itertools.cycle(groups)
+    else:
+        targets = itertools.cycle([{core} for core in sorted(os.sched_getaffinity(0))])
+    lock = threading.Lock()
+
+    def _pin_worker():
+        with lock:
+            target = next(targets)
+        try:
+            os.sched_setaffinity(0, target)
+        except OSError:
+            logger.debug("Unable to pin worker thread to CPUs %s", target)
+
+    return _pin_worker
+
+
+def _available_cpus() -> int:
+    """
+    Number of CPUs actually available to this process.
+
+    Unlike cpu_count(), sched_getaffinity respects cgroup/container CPU
+    quotas, so worker counts do not scale with the host machine when
+    running inside a restricted container.
+
+    :return: CPU count available to the current process
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # Not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+@functools.lru_cache(maxsize=None)
+def _has_running_loop(code) -> bool:
+    """
+    Check whether a run method contains a 'while self.running' loop.
+
+    The source is parsed once per code object and the result cached, so
+    repeated submissions of the same Application class pay nothing. An
+    AST walk is used rather than a substring scan so comments cannot
+    produce false positives and formatting variations such as
+    'while (self.running):' are still recognised.
+
+    :param code: Code object of the Application's run method
+    :return: True if the method loops on self.running
+    """
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(code)))
+    except (OSError, SyntaxError):
+        # Source unavailable (e.g. defined interactively); fall back to
+        # a bytecode-level check for the attribute name
+        return "running" in code.co_names
+    return any(
+        isinstance(node, ast.While)
+        and isinstance(node.test, ast.Attribute)
+        and node.test.attr == "running"
+        and isinstance(node.test.value, ast.Name)
+        and node.test.value.id == "self"
+        for node in ast.walk(tree)
+    )
+
+
+class ApplicationServer:  # pylint: disable=too-many-instance-attributes
     """
     The Application Server is responsible for displaying and interacting with
     any Application that is added to it.
@@ -57,49 +262,85 @@ class ApplicationServer:
             Provided Thread is not a Future
             """
 
-    class ApplicationData:  # pylint: disable=too-few-public-methods
-        """
-        Class for tracking of Application Data
-        """
-
-        def __init__(self, application: Application):
-            """
-            Create ApplicationData Instance
-
-            :param application: Application(type) to add
-            """
-            self.runtime = application
-
     def __init__(
         self,
         name: str = "DS Application Server",
-        workers: int = int((cpu_count() * 2) - 1),
+        workers: Union[int, None] = None,
         autostart=False,
+        pin_workers=False,
     ):
         """
         Initialise the Application Server
 
         :param name: [str] Cosmetic name of the server
-        :param workers: [int] Number of worker threads
+        :param workers: [int] Number of worker threads, or None to size
+            from the CPUs available to this process
         :param autostart: [bool] Start threading immediately
+        :param pin_workers: [bool] Pin worker threads to CPU cores,
+            where the platform supports it
         """
+        if workers is None:
+            # Cap like concurrent.futures' own default; the executor
+            # only spawns threads as submissions demand them, so this is
+            # an upper bound, not a pre-allocation
+            workers = min(32, (_available_cpus() * 2) - 1)
+        # Only configure logging if the host process has not already
+        # done so itself
+        if not logging.getLogger().handlers:
+            _configure_default_logging()
+
         self.server_name = name
-        self.thread_pool = ThreadPoolExecutor(workers)
-        self.token_memory = SharedMemory(create=True, name="TokenStore", size=64)
+        self._workers = workers
+        self._pin_workers = pin_workers
+        self._thread_pool = None
         self.applications = {}
+        self._done_queue = queue.SimpleQueue()
+        self._token_memory = None
+        self._check_cache = None
         self.__autostart = autostart
         self.__started = False
 
         # Set this instance as the default application server if one is not
         # setup
-        logging.info("ApplicationServer started (%s) instance", self.server_name)
+        logger.info("ApplicationServer started (%s) instance", self.server_name)
         global APP_SERVER_DEFAULT_INSTANCE  # pylint: disable=global-statement
         if APP_SERVER_DEFAULT_INSTANCE is None:
-            logging.debug(
+            logger.debug(
                 "Creating default ApplicationServer instance as one is not set"
             )
             APP_SERVER_DEFAULT_INSTANCE = self
 
+    @property
+    def thread_pool(self) -> ThreadPoolExecutor:
+        """
+        Worker pool for application threads.
+
+        Created on first use, so a server constructed purely for
+        inspection (as test fixtures are) never wires up a pool.
+        """
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                self._workers,
+                thread_name_prefix=f"{self.__class__.__name__}Worker",
+                initializer=_make_pin_initializer() if self._pin_workers else None,
+            )
+        return self._thread_pool
+
+    @property
+    def token_memory(self) -> SharedMemory:
+        """
+        Shared memory segment for cross-process token exchange.
+
+        Allocated lazily on first access under a name unique to this
+        server, so constructing a server costs no shm syscalls and two
+        servers in one process cannot collide. Released by shutdown().
+        """
+        if self._token_memory is None:
+            self._token_memory = SharedMemory(
+                create=True, name=f"TokenStore-{uuid4().hex}", size=64
+            )
+        return self._token_memory
+
     def start_application(self, app: Application) -> None:
         """
         Create Thread Futures for Application and
@@ -115,14 +356,12 @@ class ApplicationServer:
                     app.__class__.__name__}'."""
             )
 
-        if str(inspect.getsource(app.run)).count("while self.running") == 0:
-            logger.warning(
-                "Application '%s' does not have a 'while self.running' loop",
-                app.__class__.__name__,
-            )
-        self.applications[self.thread_pool.submit(app.run)] = self.ApplicationData(
-            application=app
-        )
+        thread = self.thread_pool.submit(app.run)
+        self.applications[thread] = app
+        self._check_cache = None
+        # Wake the server loop when the application finishes, so run()
+        # never has to poll the futures.
+        thread.add_done_callback(self._application_done)
         # logger.debug(
         #    f"""{
         #        app.__class__.__name__}(name:str('{
@@ -143,6 +382,16 @@ class ApplicationServer:
             logger.debug("Starting application server automatically")
             self.run()
 
+    def _application_done(self, thread: concurrent.futures._base.Future):
+        """
+        Done callback for application threads: invalidate the cached
+        application_check result and wake the run() loop.
+
+        :param thread: Completed thread Future for the application
+        """
+        self._check_cache = None
+        self._done_queue.put(thread)
+
     def remove_application(self, thread: concurrent.futures._base.Future):
         """
         Remove Application from the server gracefully,
@@ -157,34 +406,38 @@ class ApplicationServer:
             raise self.Exceptions.NotFuture(
                 "remove_application expected Future, " f"got {type(thread)}"
             )
-        logger.debug("Sending stop to Application at 0x%s", id(thread))
-        start = time.time()
-        logger.debug("Waiting for 0x%s to terminate...", id(thread))
-        while thread.running():
-            self.applications[thread].runtime.running = False
-            if time.time() - start >= 3.0:
-                logger.warning(
-                    (
-                        "Application 0x%s is not responding to termination signal",
-                        id(thread),
-                    )
-                )
-                logger.info(("Attempting forceful termination for 0x%s", id(thread)))
-                exception = thread.exception(2)
-                if exception:
-                    logger.error(
-                        (
-                            "Application at 0x%s threw exception: %s",
-                            id(thread),
-                            exception,
-                        )
-                    )
+        # Resolve the id() and dict lookup once up front
+        tid = id(thread)
+        runtime = self.applications[thread]
+        logger.debug("Sending stop to Application at 0x%s", tid)
+        if thread.running():
+            runtime.running = False
+        logger.debug("Waiting for 0x%s to terminate...", tid)
+        try:
+            # Block until the worker finishes instead of polling it;
+            # the wait costs no CPU and wakes as soon as the run method
+            # actually returns
+            thread.result(timeout=3.0)
+        except concurrent.futures.TimeoutError:
+            logger.warning(
+                "Application 0x%s is not responding to termination signal",
+                tid,
+            )
+            logger.info("Attempting forceful termination for 0x%s", tid)
+            thread.cancel()
+        except Exception as exception:  # pylint: disable=broad-except
+            logger.error(
+                "Application at 0x%s threw exception: %s",
+                tid,
+                exception,
+            )
         logger.info(
             "Application 0x%s (%s) Terminated",
-            id(thread),
-            self.applications[thread].runtime.app_name,
+            tid,
+            runtime.app_name,
         )
         del self.applications[thread]
+        self._check_cache = None
 
     def shutdown(self):
         """
@@ -195,9 +448,19 @@ class ApplicationServer:
             self.__class__.__name__,
             self.server_name,
         )
-        for application_thread in list(self.applications.keys()):
+        # remove_application deletes the entry, so draining the dict this
+        # way needs no list copy of the keys
+        while self.applications:
+            application_thread = next(iter(self.applications))
             logger.info("Terminating Application at 0x%s", id(application_thread))
             self.remove_application(application_thread)
+        if self._token_memory is not None:
+            self._token_memory.close()
+            self._token_memory.unlink()
+            self._token_memory = None
+        # Wake run() if it is blocked on the done queue so it can
+        # observe the now-empty application dict and return
+        self._done_queue.put(None)
 
     def application_check(
         self, thread: Union[concurrent.futures._base.Future, None] = None
@@ -209,36 +472,55 @@ class ApplicationServer:
         :return: tuple of applications that are not alive
         """
         not_alive = []
-        if not thread:  # pylint: disable=too-many-nested-blocks
+        if not thread:
+            # The result only changes when an application is added,
+            # removed or finishes, all of which clear the cache, so
+            # repeated checks are a single attribute read
+            if self._check_cache is not None:
+                return self._check_cache
             for key in self.applications:
                 if not key.running():
                     error = key.exception()
                     if error:
-                        tb = traceback.format_exception(
-                            type(error), error, error.__traceback__
+                        # Hand the full exception to the logging framework;
+                        # the handler formats the traceback once, and only
+                        # if its level accepts the record
+                        logger.error(
+                            "Application at 0x%s stopped with exception",
+                            id(key),
+                            exc_info=(type(error), error, error.__traceback__),
                         )
-                        for line in tb:
-                            line = line.strip("\r")
-                            if line.count("\n") == 0:
-                                line = [line]
-                            else:
-                                line = line.split("\n")
-                                if line[len(line) - 1] == "":
-                                    del line[-1]
-                            for line_detail in line:
-                                logger.error("0x%s: %s", id(key), line_detail)
                     else:
                         logger.warning(
-                            (
-                                "Application at 0x%s "
-                                "has stopped running. Terminating",
-                                id(key),
-                            )
+                            "Application at 0x%s has stopped running. Terminating",
+                            id(key),
                         )
                     not_alive.append(key)
-            return tuple(not_alive)
+            self._check_cache = tuple(not_alive)
+            return self._check_cache
         return () if thread.running() else (thread,)
 
+    def _handle_completion(self, thread: concurrent.futures._base.Future):
+        """
+        Log the outcome of a finished application thread, then remove
+        it from the server.
+
+        :param thread: Completed thread Future for the application
+        """
+        error = thread.exception()
+        if error:
+            logger.error(
+                "Application at 0x%s stopped with exception",
+                id(thread),
+                exc_info=(type(error), error, error.__traceback__),
+            )
+        else:
+            logger.warning(
+                "Application at 0x%s has stopped running. Terminating",
+                id(thread),
+            )
+        self.remove_application(thread)
+
     def run(self):
         """
         Start Application Server
@@ -246,18 +528,25 @@ class ApplicationServer:
         self.__started = True
         try:
             logger.debug("Press Ctrl-C to stop it all")
-            while True:
-                for application in self.application_check():
-                    self.remove_application(application)
-                if len(self.applications) == 0:
-                    logger.info("No applications running")
-                    break
+            while self.applications:
+                # Block until an application finishes; the done callback
+                # registered in start_application feeds this queue, so no
+                # CPU is spent while applications are running.
+                thread = self._done_queue.get()
+                if thread is None or thread not in self.applications:
+                    # None is the wake-up sentinel from shutdown();
+                    # anything else already removed can be ignored
+                    continue
+                self._handle_completion(thread)
+            logger.info("No applications running")
         except KeyboardInterrupt:
-            self.shutdown()
-            self.thread_pool.shutdown()
+            # Swallow Ctrl-C; the finally block below performs the
+            # cleanup exactly once
+            pass
         finally:
             self.shutdown()
-            self.thread_pool.shutdown()
+            if self._thread_pool is not None:
+                self._thread_pool.shutdown()
 
 
 class Application(ABC):
@@ -270,58 +559,49 @@ class Application(ABC):
     this class will create a default instance.
     """
 
+    __slots__ = ("app_name", "app_id", "logger", "meta", "server", "_stop")
+
+    @dataclass(slots=True)
     class AppMeta:
         """
         Application Meta Class. This class provides metadata for
         an Application Class.
 
-        This Class prevents incorrect types being assigned to
-        attributes in an effort to make sure the data types are
-        adhered to so little to no checking needs to be done
-        on data types during manipulation.
-        """
-
-        def __setattr_function__(self, key: str, value: any):
-            if key not in self.__dict__:
-                message = f"The attribute '{key}' does not exist in AppMeta"
-                raise NameError(message)
-            if not isinstance(value, type(self.__dict__[key])):
-                raise TypeError(
-                    (
-                        f"Type mismatch. Expected type {self.__dict__[key]}"
-                        f", got {type(value)}"
-                    )
-                )
-            self.__dict__[key] = value
-
-        def __init__(self, **kwargs):
-            """
-            Application MetaData
-            """
-
-            # Default Configuration
-            self.__dict__ = {
-                "maximised": False,  # Is Application Maximised
-                "cascade": False,  # Should application Cascade
-                "align": HorizontalAlignment.CENTRE,  # Horizontal Alignment to Container
-                "valign": VerticalAlignment.CENTRE,  # Vertical Alignment to Container
-                "dimensions": (40, 10),  # Width, Height as a tuple.
-            }
-            self.__setattr__ = self.__setattr_function__
+        Declared as a slotted dataclass so attribute writes are plain
+        C-level slot stores; field types are validated once when the
+        metadata is constructed rather than on every assignment.
+        """
 
-            for key, value in kwargs.items():
-                self.__setattr_function__(key=key, value=value)
+        maximised: bool = False  # Is Application Maximised
+        cascade: bool = False  # Should application Cascade
+        align: HorizontalAlignment = HorizontalAlignment.CENTRE
+        valign: VerticalAlignment = VerticalAlignment.CENTRE
+        dimensions: tuple = (40, 10)  # Width, Height as a tuple.
+
+        # Expected type of each field, used for construction-time
+        # validation
+        _TYPES: ClassVar[dict] = {
+            "maximised": bool,
+            "cascade": bool,
+            "align": HorizontalAlignment,
+            "valign": VerticalAlignment,
+            "dimensions": tuple,
+        }
+
+        def __post_init__(self):
+            for key, expected in self._TYPES.items():
+                value = getattr(self, key)
+                if not isinstance(value, expected):
+                    raise TypeError(
+                        f"Type mismatch. Expected type {expected}, got {type(value)}"
+                    )
 
         def dict(self):
             """
             Return Application Configuration as a Dictionary
             :return:
             """
-            dictionary = {}
-            for key, value in self.__dict__.items():
-                if not key.startswith("_"):
-                    dictionary[key] = value
-            return dictionary
+            return asdict(self)
 
         def json(self, **kwargs):
             """
@@ -333,20 +613,56 @@ class Application(ABC):
             return json.dumps(self.dict(), **kwargs)
 
         def __repr__(self):
-            dictionary = {}
-            for key, value in self.__dict__.items():
-                if not key.startswith("_"):
-                    dictionary[key] = value
-            return str(dictionary)
+            return str(self.dict())
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Warn about a missing 'while self.running' loop once, when the
+        # subclass is defined, keeping start_application free of any
+        # inspection work
+        run = cls.__dict__.get("run")
+        if run is not None and not getattr(run, "__isabstractmethod__", False):
+            if not _has_running_loop(run.__code__):
+                logger.warning(
+                    "Application '%s' does not have a 'while self.running' loop",
+                    cls.__name__,
+                )
 
     def __repr__(self):
         return f"{self.__class__.__name__} at 0x{id(self)}"
 
+    @property
+    def running(self) -> bool:
+        """
+        True until the Application is told to stop.
+
+        Backed by a threading.Event so run methods that want to block
+        can wait on self.stopped_wait() instead of polling, while the
+        usual 'while self.running' loops keep working unchanged.
+        """
+        return not self._stop.is_set()
+
+    @running.setter
+    def running(self, value: bool):
+        if value:
+            self._stop.clear()
+        else:
+            self._stop.set()
+
+    def stopped_wait(self, timeout: Union[float, None] = None) -> bool:
+        """
+        Block until the Application is told to stop.
+
+        :param timeout: Seconds to wait, or None to wait indefinitely
+        :return: True if the stop signal arrived within the timeout
+        """
+        return self._stop.wait(timeout)
+
     def __init__(
         self,
         name,
-        app_id: UUID = uuid4(),
-        app_meta: AppMeta = AppMeta(),
+        app_id: Union[UUID, None] = None,
+        app_meta: Union[AppMeta, None] = None,
         server: Union[ApplicationServer, None] = None,
     ):
         """
@@ -363,6 +679,14 @@ class Application(ABC):
         :param server: Optional Server Instance (Optional)
         """
 
+        # Construct per-instance defaults here rather than in the
+        # signature, where they would be evaluated once at import time
+        # and shared between every Application that omits them
+        if app_id is None:
+            app_id = uuid4()
+        if app_meta is None:
+            app_meta = self.AppMeta()
+
         # Type Checks
         if not isinstance(app_id, UUID):
             raise TypeError(f"{self.__class__.__name__}(app_id) must be of type UUID")
@@ -373,7 +697,7 @@ class Application(ABC):
         # Set Instance Variables
         self.app_name = name
         self.app_id = app_id
-        self.running = True
+        self._stop = threading.Event()
         self.logger = logger
         self.meta = app_meta
 
@@ -413,5 +737,5 @@ class Application(ABC):
         Stop the Application. Users can do whatever they need
         to do to clean up here.
         """
-        logging.info("Application '%s' received stop signal", self.app_name)
+        logger.info("Application '%s' received stop signal", self.app_name)
         self.running = False
@@ -5,23 +5,7 @@ Project-wide Enumerators
 import enum
 
 
-def extend_enum(inherited_enum: enum.EnumMeta):
-    """
-    Class Decorator to Extend Enumerators
-    """
-
-    def wrapper(added_enum: enum.EnumMeta) -> enum.EnumMeta:
-        joined = {}
-        for item in inherited_enum:
-            joined[item.name] = item.value
-        for item in added_enum:
-            joined[item.name] = item.value
-        return enum.Enum(added_enum.__name__, joined)
-
-    return wrapper
-
-
-class Alignment(str, enum.Enum):
+class Alignment(enum.IntFlag):
     """
     Base Alignment enumerator
     """
@@ -34,7 +18,7 @@ class Alignment(str, enum.Enum):
     JUSTIFY = 32
 
 
-class VerticalAlignment(str, enum.Enum):
+class VerticalAlignment(enum.IntFlag):
     """
     Vertical Alignment Enumerator
     """
@@ -44,7 +28,7 @@ class VerticalAlignment(str, enum.Enum):
     BOTTOM = Alignment.BOTTOM
 
 
-class HorizontalAlignment(str, enum.Enum):
+class HorizontalAlignment(enum.IntFlag):
     """
     Horizontal Alignment Enumerator
 
@@ -61,11 +45,13 @@ class HorizontalAlignment(str, enum.Enum):
     RIGHT = Alignment.RIGHT
 
 
-@extend_enum(HorizontalAlignment)
-class TextAlignment(str, enum.Enum):
+class TextAlignment(enum.IntFlag):
     """
     Extended Horizontal Alignment Enumerator
     Also Contains JUSTIFY for Text alignment
     """
 
+    LEFT = Alignment.LEFT
+    CENTRE = Alignment.CENTRE
+    RIGHT = Alignment.RIGHT
     JUSTIFY = Alignment.JUSTIFY
@@ -2,10 +2,11 @@
 Events Subsystem
 """
 
-import os
 from abc import ABC, abstractmethod
 from enum import Enum
 
+from ._platform import IS_WIN
+
 
 class Event(ABC):  # pylint: disable=too-few-public-methods
     """
@@ -47,7 +48,7 @@ class _Win32ClickType(Enum):
     name = "NT"
 
 
-ClickType = _Win32ClickType if os.name.lower() == "nt" else _CursesClickType
+ClickType = _Win32ClickType if IS_WIN else _CursesClickType
 
 
 class MouseEvent(InputEvent):  # pylint: disable=too-few-public-methods
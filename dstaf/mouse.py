@@ -2,15 +2,16 @@
 Mouse Actions
 """
 
-import platform
 from abc import ABC
-from enum import Enum, EnumType
+from enum import Enum, EnumType, IntEnum
 from typing import Tuple
 
+from ._platform import IS_WIN
+
 
 class _MouseEvent(ABC):
 
-    class Click(Enum):
+    class Click(IntEnum):
         """
         Default Click Enumerator. If this is kept, the
         inheriting event will fail.
@@ -36,15 +37,19 @@ class _MouseEvent(ABC):
         """
         Convert key value to a standardised click type
         """
+        if not key_value:
+            # Idle poll; by far the most common case in an event loop,
+            # so skip the lookup entirely
+            return self.ClickType.NONE, self.Click.NONE
         if not isinstance(ignore_errors, bool):
             ignore_errors = self._ignore_errors
-        for click_type in self.ClickType:
-            if key_value in [key.value * click_type.value for key in self.Click]:
-                return click_type, self.Click(key_value)
-            if not ignore_errors:
-                raise ValueError(
-                    f"The mouse button value '{key_value}' is not a known mouse button type"
-                )
+        found = self._button_lut.get(key_value)
+        if found is not None:
+            return found
+        if not ignore_errors:
+            raise ValueError(
+                f"The mouse button value '{key_value}' is not a known mouse button type"
+            )
         return self.ClickType.NONE, self.Click.NONE
 
     def get_types(self) -> EnumType:
@@ -60,8 +65,8 @@ class _MouseEvent(ABC):
         if not isinstance(cls.Click, EnumType):
             # The Click class should be an enumerator
             raise TypeError(f"{cls.__name__}.Click is not of type Enum")
-        if "none" not in cls.Click.__dict__:
-            raise NameError(f"{cls.__name__}.Click.none must exist")
+        if "NONE" not in cls.Click.__members__:
+            raise NameError(f"{cls.__name__}.Click.NONE must exist")
         if cls.Click.NONE.value == -9:
             # This means the default Click class is present, so:
             message = f"Click(Enum) not specified in {cls.__name__}"
@@ -70,11 +75,25 @@ class _MouseEvent(ABC):
             cls._ignore_errors = kwargs["ignore_errors"]
         else:
             cls._ignore_errors = False
+        # Precompute the full (key, ClickType, Click) table once per
+        # subclass; setdefault on the lookup keeps the original
+        # first-match priority of the definition order. The frozen
+        # table is kept for introspection/iteration, the dict for the
+        # single-probe hot path in get_mouse_button.
+        cls._button_table = tuple(
+            (key.value * click_type.value, click_type, key)
+            for click_type in cls.ClickType
+            for key in cls.Click
+        )
+        lut = {}
+        for key_value, click_type, key in cls._button_table:
+            lut.setdefault(key_value, (click_type, key))
+        cls._button_lut = lut
 
 
 class _WindowsMouseEvent(_MouseEvent):
 
-    class Click(Enum):
+    class Click(IntEnum):
         """
         Mouse Click Integer Values for Windows Terminals
         """
@@ -89,7 +108,7 @@ class _WindowsMouseEvent(_MouseEvent):
 
 class _CursesMouseEvent(_MouseEvent):
 
-    class Click(Enum):
+    class Click(IntEnum):
         """
         Mouse Click Integer Values for Curses
         """
@@ -102,7 +121,4 @@ class _CursesMouseEvent(_MouseEvent):
         SCROLL_DOWN = 2097152
 
 
-if platform.system().lower() == "Windows":
-    Event = _WindowsMouseEvent
-else:
-    Event = _CursesMouseEvent
+Event = _WindowsMouseEvent if IS_WIN else _CursesMouseEvent
@@ -1,41 +1,35 @@
-"""
-Perform Unit Tests
-"""
-
-from dstaf import Application, ApplicationServer
-
-default_application_server = ApplicationServer(autostart=False)
-
-class TestApp(Application):
-    def run(self):
-        pass
-
-test_application = TestApp(name="Test Application",
-                           server=default_application_server)
-
-def test_application_server_default_name():
-    """
-    Ensures the Application Server Default Name has not changed
-    """
-    assert default_application_server.server_name == "DS Application Server"
-
-def test_application_server_application_check():
-    """
-    The default application server should have only one application
-    """
-    assert len(default_application_server.application_check()) == 1
-
-def test_application_server_remove_application():
-    default_application_server.remove_application(
-        thread=default_application_server.application_check()[0]
-    )
-    assert default_application_server.application_check() == ()
-
-def test_application_creation():
-    """
-    Add an application, and check it is reported as running
-    """
-    assert test_application.running == True
-    assert test_application.app_name == "Test Application"
-    assert test_application.server == default_application_server
-
+"""
+Perform Unit Tests
+"""
+
+import pytest
+
+# Read-only state checks against the shared server, consolidated into
+# a single parametrized test so the module-scoped fixtures are resolved
+# through one test function
+_STATE_CHECKS = {
+    "default_name": lambda server, app: server.server_name == "DS Application Server",
+    "app_count": lambda server, app: len(server.application_check()) == 1,
+    "app_running": lambda server, app: app.running is True,
+    "app_name": lambda server, app: app.app_name == "Test Application",
+    "app_server": lambda server, app: app.server is server,
+}
+
+
+@pytest.mark.parametrize("check", _STATE_CHECKS)
+def test_application_server_state(default_application_server,
+                                  test_application, check):
+    """
+    Check the default name, application count and application state of
+    the shared server
+    """
+    assert _STATE_CHECKS[check](default_application_server, test_application)
+
+
+def test_application_server_remove_application(fresh_application_server,
+                                               make_test_app):
+    make_test_app(fresh_application_server)
+    fresh_application_server.remove_application(
+        thread=fresh_application_server.application_check()[0]
+    )
+    assert fresh_application_server.application_check() == ()
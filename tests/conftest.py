@@ -0,0 +1,55 @@
+"""
+Shared Test Fixtures
+"""
+
+import concurrent.futures
+
+import pytest
+
+from dstaf import Application, ApplicationServer
+
+
+class _TestApp(Application):
+    """
+    Minimal Application whose run() returns immediately
+    """
+
+    def run(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def make_test_app():
+    """
+    Factory fixture building a _TestApp on a given server; waits for
+    its (immediately returning) run() future so tests observe a
+    settled server
+    """
+
+    def _make(server, name="Test Application"):
+        application = _TestApp(name=name, server=server)
+        concurrent.futures.wait(list(server.applications))
+        return application
+
+    return _make
+
+
+# Module scope: the server is construct-once, and the read-only tests
+# only inspect its state
+@pytest.fixture(scope="module")
+def default_application_server():
+    return ApplicationServer(autostart=False)
+
+
+@pytest.fixture(scope="module")
+def test_application(default_application_server, make_test_app):
+    return make_test_app(default_application_server)
+
+
+@pytest.fixture
+def fresh_application_server():
+    """
+    Function-scoped server for tests that mutate server state, so the
+    module-scoped instance stays untouched regardless of test order
+    """
+    return ApplicationServer(autostart=False)